@@ -0,0 +1,69 @@
+"""
+Measures service cold start: the time to import the FastAPI app in a fresh
+interpreter, and the time to warm up the Polly and Vertex AI clients.
+
+Run from the repository root:
+    python -m src.main.benchmarks.startup_benchmark --runs 5 --max-import-seconds 2.0
+
+Exits with a non-zero status when the median import time exceeds
+--max-import-seconds, so it can be used as a regression check in CI.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+IMPORT_SNIPPET = """
+import json, time
+start = time.perf_counter()
+import src.main.main
+import_seconds = time.perf_counter() - start
+warmup_seconds = None
+if {warm_up}:
+    from src.main.services.warmup_service import warm_up_clients
+    start = time.perf_counter()
+    warm_up_clients()
+    warmup_seconds = time.perf_counter() - start
+print(json.dumps({{"import_seconds": import_seconds, "warmup_seconds": warmup_seconds}}))
+"""
+
+
+def run_once(warm_up):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET.format(warm_up=warm_up)],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    # The app logs to stderr, so the last stdout line is the measurement.
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TTS service cold start.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to start.")
+    parser.add_argument("--warm-up", action="store_true", help="Also time client warm-up.")
+    parser.add_argument("--max-import-seconds", type=float, default=None,
+                        help="Fail if the median import time exceeds this value.")
+    args = parser.parse_args()
+
+    samples = [run_once(args.warm_up) for _ in range(args.runs)]
+    import_times = [s["import_seconds"] for s in samples]
+    median_import = statistics.median(import_times)
+
+    print(f"App import:  median {median_import:.3f}s, min {min(import_times):.3f}s, "
+          f"max {max(import_times):.3f}s over {args.runs} run(s)")
+
+    if args.warm_up:
+        warmup_times = [s["warmup_seconds"] for s in samples]
+        print(f"Warm-up:     median {statistics.median(warmup_times):.3f}s, "
+              f"min {min(warmup_times):.3f}s, max {max(warmup_times):.3f}s")
+
+    if args.max_import_seconds is not None and median_import > args.max_import_seconds:
+        print(f"FAIL: median import time {median_import:.3f}s exceeds {args.max_import_seconds:.3f}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Offline bulk pre-generation for a whole library of PDFs.
+
+Run from the repository root:
+    python -m src.main.bulk_tts path/to/books --workers 8 --gemini-rps 2 --polly-rps 40
+    python -m src.main.bulk_tts manifest.txt --summary output/bulk_summary.json
+    python -m src.main.bulk_tts path/to/books --resume --cache-dir output/.cache
+
+The source can be a PDF, a directory of PDFs, or a manifest with one PDF path per line.
+Each page is written as a single bundle; pass --loose-files to also get the per-file layout.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+from dotenv import load_dotenv
+
+from src.main.services.bulk_tts_service import collect_pdf_paths, run_bulk_tts
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate TTS output for many PDFs in one run.")
+    parser.add_argument("source", help="PDF file, directory of PDFs, or manifest file.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count).")
+    parser.add_argument("--gemini-rps", type=float, default=None, help="Global limit on Gemini calls per second.")
+    parser.add_argument("--polly-rps", type=float, default=None, help="Global limit on Polly calls per second.")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Directory for cached Gemini and Polly results, shared by workers and across runs.")
+    parser.add_argument("--resume", action="store_true",
+                        help="Write to a stable output directory per book and skip pages that are already done.")
+    parser.add_argument("--loose-files", action="store_true",
+                        help="Also write the loose PNG, JSON and per-block audio files next to each bundle.")
+    parser.add_argument("--summary", default=None, help="Optional path to write the run summary as JSON.")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    if not os.path.exists(args.source):
+        logger.error("Source not found: %s", args.source)
+        sys.exit(1)
+
+    pdf_paths = collect_pdf_paths(args.source)
+    if not pdf_paths:
+        logger.error("No PDF files found in %s", args.source)
+        sys.exit(1)
+
+    summary = run_bulk_tts(
+        pdf_paths,
+        workers=args.workers,
+        gemini_calls_per_second=args.gemini_rps,
+        polly_calls_per_second=args.polly_rps,
+        cache_dir=args.cache_dir,
+        resume=args.resume,
+        write_loose_files=args.loose_files
+    )
+    logger.info("%s Took %.1f seconds.", summary["message"], summary["elapsed_seconds"])
+
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summary, f, indent=4)
+        logger.info("Saved run summary: %s", args.summary)
+
+    if summary["status"] != "success":
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
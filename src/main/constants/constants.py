@@ -1,3 +1,6 @@
+# Root directory for pipeline output; shared by the writers and the bundle download endpoint.
+OUTPUT_ROOT = "output"
+
 # import os
 # from datetime import datetime
 
@@ -0,0 +1,27 @@
+import logging
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+from src.main.services.bundle_service import get_bundle_index, resolve_bundle_path
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.get("/bundles/{output_folder}/{bundle_name}")
+async def download_bundle(output_folder: str, bundle_name: str):
+    bundle_path = resolve_bundle_path(output_folder, bundle_name)
+    if bundle_path is None:
+        raise HTTPException(status_code=404, detail="Bundle not found.")
+    # FileResponse answers Range requests with 206 Partial Content, so the reader
+    # can fetch the index first and then only the audio ranges it needs.
+    return FileResponse(bundle_path, media_type="application/octet-stream", filename=bundle_name)
+
+@router.get("/bundles/{output_folder}/{bundle_name}/index")
+async def bundle_index(output_folder: str, bundle_name: str):
+    try:
+        index = get_bundle_index(output_folder, bundle_name)
+    except ValueError as e:
+        logger.error("Failed to read bundle index %s/%s: %s", output_folder, bundle_name, str(e))
+        raise HTTPException(status_code=422, detail="File is not a valid bundle.")
+    if index is None:
+        raise HTTPException(status_code=404, detail="Bundle not found.")
+    return index
@@ -1,7 +1,20 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from src.main.services.warmup_service import get_readiness, retry_failed_warm_up
 
 router = APIRouter()
 
 @router.get("/health")
 async def health_check():
-    return {"status": "Healthy", "message": "The TTS service is healthy."}
\ No newline at end of file
+    return {"status": "Healthy", "message": "The TTS service is healthy."}
+
+@router.get("/ready")
+async def readiness_check():
+    readiness = get_readiness()
+    if not readiness["ready"]:
+        if readiness["warmup_state"] == "failed":
+            # Let the pod recover from transient errors instead of staying out of rotation.
+            retry_failed_warm_up()
+        status = "Not ready" if readiness["warmup_state"] == "failed" else "Warming up"
+        return JSONResponse(status_code=503, content={"status": status, **readiness})
+    return {"status": "Ready", **readiness}
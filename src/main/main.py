@@ -1,11 +1,13 @@
 from fastapi import FastAPI
 from src.main.controllers.tts_controller import router as tts_router
 from src.main.controllers.health_controller import router as health_router
+from src.main.controllers.bundle_controller import router as bundle_router
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+from src.main.services.warmup_service import mark_warm_up_skipped, start_background_warm_up
 import logging
 import uvicorn
-import vertexai
 import os
 
 load_dotenv()
@@ -16,7 +18,17 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Clients are warmed in the background so the server starts accepting
+    # connections immediately; /ready reports when warm-up has finished.
+    if os.getenv('WARM_UP_CLIENTS', 'true').lower() != 'false':
+        start_background_warm_up()
+    else:
+        mark_warm_up_skipped()
+    yield
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,20 +38,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-VERTEX_AI_PROJECT = os.getenv('VERTEX_AI_PROJECT')
-VERTEX_AI_LOCATION = os.getenv('VERTEX_AI_LOCATION')
-
-try:
-    if VERTEX_AI_PROJECT and VERTEX_AI_LOCATION:
-        vertexai.init(project=VERTEX_AI_PROJECT, location=VERTEX_AI_LOCATION)
-        logger.info("Vertex AI initialized successfully.")
-    else:
-        logger.warning("Vertex AI credentials not configured. Some features may not work.")
-except Exception as e:
-    logger.error("Failed to initialize Vertex AI: %s", str(e))
-    logger.warning("Continuing without Vertex AI. Some features may not work.")
-
 app.include_router(tts_router, prefix="/api")
+app.include_router(bundle_router, prefix="/api")
 app.include_router(health_router)
 
 if __name__ == "__main__":
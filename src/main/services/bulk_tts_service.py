@@ -0,0 +1,210 @@
+import os
+import time
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import fitz  # PyMuPDF
+
+from src.main.services.tts_service import create_output_dir, get_page_bundle_path, process_pdf_page
+from src.main.services.warmup_service import warm_up_clients
+from src.main.utils.polly_session_utils import get_polly_client
+from src.main.utils.rate_limit_utils import RateLimiter, configure_rate_limiters
+from src.main.utils.cache_utils import configure_cache
+
+logger = logging.getLogger(__name__)
+
+
+def collect_pdf_paths(source):
+    """
+    Resolves the bulk input to a list of PDF paths. The source can be a single PDF,
+    a directory (searched recursively), or a manifest file with one PDF path per line.
+    Relative manifest entries are resolved against the manifest's directory.
+    Returns an empty list if the source does not exist.
+    """
+    if not os.path.exists(source):
+        return []
+
+    if os.path.isdir(source):
+        pdf_paths = []
+        for root, _, files in os.walk(source):
+            pdf_paths.extend(os.path.join(root, name) for name in files if name.lower().endswith(".pdf"))
+        return sorted(pdf_paths)
+
+    if source.lower().endswith(".pdf"):
+        return [source]
+
+    manifest_dir = os.path.dirname(os.path.abspath(source))
+    pdf_paths = []
+    with open(source) as manifest:
+        for line in manifest:
+            entry = line.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            pdf_paths.append(entry if os.path.isabs(entry) else os.path.join(manifest_dir, entry))
+    return pdf_paths
+
+
+def _init_worker(gemini_limiter, polly_limiter, cache_dir, log_level):
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    configure_rate_limiters(gemini_limiter, polly_limiter)
+    configure_cache(cache_dir)
+    # Each worker creates its clients once and reuses them for every page it processes.
+    warm_up_clients()
+
+
+def _process_page_task(pdf_path, page_number, output_dir, output_name, write_loose_files):
+    return process_pdf_page(
+        pdf_path, page_number, output_dir, output_name, get_polly_client(), write_loose_files=write_loose_files
+    )
+
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def _plan_books(pdf_paths, resume):
+    books = []
+    used_names = set()
+    for pdf_path in pdf_paths:
+        output_name = os.path.basename(pdf_path)
+        book_name = os.path.splitext(output_name)[0]
+        if resume:
+            # Resumable output is named after the PDF's location, not its position in this
+            # run's input, so a newly added book can never pick up another book's pages.
+            path_hash = hashlib.sha256(os.path.realpath(pdf_path).encode("utf-8")).hexdigest()[:8]
+            unique_name = f"{book_name}-{path_hash}"
+        else:
+            # Books with the same file name in different folders get their own output directory.
+            unique_name, suffix = book_name, 2
+            while unique_name in used_names:
+                unique_name = f"{book_name}-{suffix}"
+                suffix += 1
+            used_names.add(unique_name)
+
+        book = {
+            "pdf_path": pdf_path,
+            "output_name": output_name,
+            "output_dir": None,
+            "page_count": 0,
+            "results": [],
+            "errors": {}
+        }
+        books.append(book)
+
+        try:
+            with fitz.open(pdf_path) as pdf:
+                book["page_count"] = len(pdf)
+        except Exception as e:
+            # One unreadable PDF should not stop the rest of the library.
+            book["errors"]["pdf"] = str(e)
+            logger.error("Skipping %s: could not open PDF: %s", pdf_path, str(e))
+            continue
+
+        book["output_dir"] = create_output_dir(unique_name, timestamped=not resume)
+    return books
+
+
+def _find_pending_pages(books, resume):
+    """
+    Returns the (book, page_number) pairs still to process and how many were skipped.
+    With resume, pages that already have a bundle are recorded as skipped results.
+    """
+    pending = []
+    skipped = 0
+    for book in books:
+        for page_number in range(book["page_count"]):
+            if resume and os.path.exists(get_page_bundle_path(book["output_dir"], book["output_name"], page_number)):
+                book["results"].append({"page_number": page_number, "skipped": True})
+                skipped += 1
+            else:
+                pending.append((book, page_number))
+    return pending, skipped
+
+
+def run_bulk_tts(pdf_paths, workers=None, gemini_calls_per_second=None, polly_calls_per_second=None,
+                 cache_dir=None, resume=False, write_loose_files=False):
+    """
+    Processes every page of every PDF across a process pool, writing one bundle
+    per page into a directory per book under the output root. Gemini and Polly
+    calls are throttled globally across all workers when a calls-per-second
+    limit is given.
+
+    With cache_dir, Gemini responses and Polly audio are cached on disk by content,
+    so unchanged pages cost no API calls on later runs. With resume, each book is
+    written to a directory named after its path and pages that already have a bundle are skipped.
+    Only the page bundles are written unless write_loose_files is True.
+    """
+    books = _plan_books(pdf_paths, resume)
+    failed_books = sum(1 for book in books if book["errors"])
+    failed_pages = 0
+
+    pending, skipped = _find_pending_pages(books, resume)
+
+    logger.info(
+        "Processing %d page(s) from %d PDF(s); %d page(s) already done",
+        len(pending), len(books), skipped
+    )
+
+    gemini_limiter = RateLimiter(gemini_calls_per_second) if gemini_calls_per_second else None
+    polly_limiter = RateLimiter(polly_calls_per_second) if polly_calls_per_second else None
+
+    completed = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(gemini_limiter, polly_limiter, cache_dir, logging.getLogger().level)
+    ) as executor:
+        futures = {}
+        for book, page_number in pending:
+            future = executor.submit(
+                _process_page_task, book["pdf_path"], page_number, book["output_dir"], book["output_name"],
+                write_loose_files
+            )
+            futures[future] = (book, page_number)
+
+        for future in as_completed(futures):
+            book, page_number = futures[future]
+            try:
+                book["results"].append(future.result())
+            except Exception as e:
+                failed_pages += 1
+                book["errors"][str(page_number)] = str(e)
+                logger.error("Failed page %d of %s: %s", page_number, book["pdf_path"], str(e))
+
+            completed += 1
+            elapsed = time.perf_counter() - start
+            pages_per_second = completed / elapsed if elapsed > 0 else 0.0
+            eta = (len(pending) - completed) / pages_per_second if pages_per_second > 0 else 0.0
+            logger.info(
+                "Progress: %d/%d page(s), %.2f pages/s, elapsed %s, ETA %s",
+                completed, len(pending), pages_per_second, _format_duration(elapsed), _format_duration(eta)
+            )
+
+    for book in books:
+        book["results"].sort(key=lambda result: result["page_number"])
+
+    return {
+        "status": "success" if failed_books == 0 and failed_pages == 0 else "error",
+        "message": (
+            f"Processed {completed - failed_pages} of {len(pending)} page(s) from {len(books)} PDF(s); "
+            f"skipped {skipped} finished page(s); {failed_books} unreadable PDF(s)."
+        ),
+        "elapsed_seconds": time.perf_counter() - start,
+        "books": [
+            {
+                "pdf_path": book["pdf_path"],
+                "output_dir": book["output_dir"],
+                "results": book["results"],
+                "errors": book["errors"]
+            }
+            for book in books
+        ]
+    }
@@ -0,0 +1,32 @@
+import os
+import logging
+
+from src.main.constants.constants import OUTPUT_ROOT
+from src.main.utils.bundle_utils import BUNDLE_EXTENSION, read_bundle_index
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_bundle_path(output_folder, bundle_name):
+    """
+    Returns the path of a bundle inside the output directory, or None if the
+    name is not a bundle or would point outside the output directory.
+    """
+    if not bundle_name.endswith(BUNDLE_EXTENSION):
+        return None
+
+    output_root = os.path.realpath(OUTPUT_ROOT)
+    bundle_path = os.path.realpath(os.path.join(output_root, output_folder, bundle_name))
+    if os.path.dirname(os.path.dirname(bundle_path)) != output_root:
+        logger.warning("Rejected bundle path outside output directory: %s/%s", output_folder, bundle_name)
+        return None
+    if not os.path.isfile(bundle_path):
+        return None
+    return bundle_path
+
+
+def get_bundle_index(output_folder, bundle_name):
+    bundle_path = resolve_bundle_path(output_folder, bundle_name)
+    if bundle_path is None:
+        return None
+    return read_bundle_index(bundle_path)
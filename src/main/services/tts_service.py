@@ -1,5 +1,6 @@
 import os
 import json
+import base64
 import tempfile
 import logging
 from datetime import datetime
@@ -10,28 +11,142 @@ from src.main.utils.image_processing_utils import (
     annotate_image_with_words, extract_page_as_base64, generate_color_palette
 )
 from src.main.utils.saving_utils import (
-    save_annotated_image, save_audio_and_speech_marks, save_block_details_as_json
+    generate_block_audio, save_annotated_image, save_audio_and_speech_marks, save_block_details_as_json
 )
-from src.main.utils.polly_session_utils import initialize_polly
-from src.main.utils.generate_block_json_utils import generate_block_json
+from src.main.utils.polly_session_utils import get_polly_client
+from src.main.utils.generate_block_json_utils import MODEL_NAME, generate_block_json
+from src.main.utils.cache_utils import load_cached_block_json, make_cache_key, store_cached_block_json
 from src.main.utils.llm_response_processing_utils import clean_llm_response
+from src.main.utils.bundle_utils import BUNDLE_EXTENSION, write_page_bundle
+from src.main.constants.constants import OUTPUT_ROOT
 
 logger = logging.getLogger(__name__)
-polly_client = initialize_polly()
 
-if polly_client is None:
-    logger.warning("Polly client is not available. Audio generation will be skipped.")
+def create_output_dir(book_name, timestamped=True):
+    if timestamped:
+        timestamp = datetime.now().strftime("%d-%m-%Y-%H-%M-%S")
+        output_dir = os.path.join(OUTPUT_ROOT, f"{book_name}-{timestamp}")
+    else:
+        output_dir = os.path.join(OUTPUT_ROOT, book_name)
+    os.makedirs(output_dir, exist_ok=True)
+    logger.info("Created output directory: %s", output_dir)
+    return output_dir
+
+def get_page_bundle_path(output_dir, output_name, page_number):
+    # The bundle is the last file written for a page, so it also marks the page as complete.
+    return os.path.join(output_dir, f"{output_name}_page_{page_number}{BUNDLE_EXTENSION}")
+
+def process_pdf_page(pdf_path, page_number, output_dir, output_name, polly_client, write_loose_files=True):
+    """
+    Runs the full pipeline for a single PDF page and returns the paths it wrote.
+    Used by both the HTTP endpoint and the offline bulk command.
+
+    The page is always packed into a bundle. The loose PNG, JSON and per-block
+    audio files are only written when write_loose_files is True, for consumers
+    of /api/tts_service that still read them.
+    """
+    with fitz.open(pdf_path) as pdf:
+        page = pdf.load_page(page_number)
+        words = page.get_text("words")
+        pix = page.get_pixmap()
+        image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+
+    # Save image and base64
+    base64_img, image_path, _ = extract_page_as_base64(
+        pdf_path, page_number, output_dir, output_name, save_image=write_loose_files
+    )
+    logger.info("Extracted image for page %d: %s", page_number, image_path)
+
+    # Generate block colors and annotate image
+    block_ids = set(w[5] for w in words)
+    color_palette = generate_color_palette(block_ids)
+    block_details = {}
+    annotate_image_with_words(image, words, color_palette, block_details)
+
+    # Save annotated image and JSON
+    annotated_image_path = None
+    json_path = None
+    if write_loose_files:
+        annotated_image_path = save_annotated_image(image, output_dir, output_name, page_number)
+        json_path = save_block_details_as_json(block_details, output_dir, output_name, page_number)
+        logger.info("Saved annotated image and block details for page %d", page_number)
+
+    # Generate and clean LLM output, reusing a cached response for identical page content
+    cache_key = make_cache_key(MODEL_NAME, base64_img, block_details)
+    block_json = load_cached_block_json(cache_key)
+    if block_json is None:
+        block_json = generate_block_json(base64_img, block_details)
+        if block_json is not None:
+            store_cached_block_json(cache_key, block_json)
+
+    # cleaned_output = clean_llm_response(block_json)
+
+    # Generate audio and speech marks
+    audio_by_block = {}
+    audio_metadata = {}
+    entries = block_json.items() if isinstance(block_json, dict) else enumerate(block_json)
+
+    for block_id, data in entries:
+        ssml = data.get("ssml")
+        if not ssml:
+            logger.warning("No SSML found for block %s on page %d", block_id, page_number)
+            continue
+        audio_bytes, speech_marks = generate_block_audio(
+            polly_client, ssml, data.get("person_type"), block_json, block_id
+        )
+        if audio_bytes:
+            audio_by_block[block_id] = audio_bytes
+
+        if write_loose_files:
+            audio_path, marks_path = save_audio_and_speech_marks(
+                f"{page_number}_{block_id}", audio_bytes, speech_marks, output_dir
+            )
+            audio_metadata[block_id] = {
+                "audio_path": audio_path,
+                "speech_marks_path": marks_path
+            }
+        logger.info("Generated audio and speech marks for block %s on page %d", block_id, page_number)
+
+    vertex_path = None
+    metadata_path = None
+    if write_loose_files:
+        # Save trimmed block JSON, now including the timing data for each block
+        vertex_path = os.path.join(output_dir, f"{output_name}_page_{page_number}_trimmed_blocks.json")
+        with open(vertex_path, "w") as f:
+            json.dump(block_json, f, indent=4)
+        logger.info("Saved trimmed block JSON for page %d", page_number)
+
+        # Save audio metadata
+        metadata_path = os.path.join(output_dir, f"page_{page_number}_audio_speech_marks_metadata.json")
+        with open(metadata_path, "w") as f:
+            json.dump(audio_metadata, f, indent=4)
+        logger.info("Saved metadata for page %d", page_number)
+
+    # Pack the page into a single indexed bundle for range-based downloads
+    bundle_path = get_page_bundle_path(output_dir, output_name, page_number)
+    write_page_bundle(bundle_path, page_number, base64.b64decode(base64_img), block_json, audio_by_block)
+    logger.info("Saved bundle for page %d: %s", page_number, bundle_path)
+
+    return {
+        "page_number": page_number,
+        "annotated_image_path": annotated_image_path,
+        "json_path": json_path,
+        "vertex_trimmed_path": vertex_path,
+        "metadata_path": metadata_path,
+        "bundle_path": bundle_path
+    }
 
 async def process_tts_request(pdf_file):
     temp_pdf = None
+    polly_client = get_polly_client()
+    # Compatibility switch for consumers that read the loose per-page files.
+    # Set WRITE_LOOSE_FILES=false to have the endpoint write only the page bundles.
+    write_loose_files = os.getenv('WRITE_LOOSE_FILES', 'true').lower() != 'false'
 
     try:
         # Setup output directory
         book_name = os.path.splitext(pdf_file.filename)[0]
-        timestamp = datetime.now().strftime("%d-%m-%Y-%H-%M-%S")
-        output_dir = os.path.join("output", f"{book_name}-{timestamp}")
-        os.makedirs(output_dir, exist_ok=True)
-        logger.info("Created output directory: %s", output_dir)
+        output_dir = create_output_dir(book_name)
 
         # Save uploaded PDF to temp location
         temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
@@ -44,77 +159,12 @@ async def process_tts_request(pdf_file):
 
         # Process each page
         with fitz.open(pdf_path) as pdf:
-            for page_number in range(len(pdf)):
-                page = pdf.load_page(page_number)
-                words = page.get_text("words")
-                pix = page.get_pixmap()
-                image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-                # Save image and base64
-                base64_img, image_path, _ = extract_page_as_base64(pdf_path, page_number, output_dir, pdf_file.filename)
-                logger.info("Saved base64 and image for page %d: %s", page_number, image_path)
-
-                # Generate block colors and annotate image
-                block_ids = set(w[5] for w in words)
-                color_palette = generate_color_palette(block_ids)
-                block_details = {}
-                annotate_image_with_words(image, words, color_palette, block_details)
-
-                # Save annotated image and JSON
-                annotated_image_path = save_annotated_image(image, output_dir, pdf_file.filename, page_number)
-                json_path = save_block_details_as_json(block_details, output_dir, pdf_file.filename, page_number)
-                logger.info("Saved annotated image and block details for page %d", page_number)
-
-
-                # Generate and clean LLM output
-                block_json = generate_block_json(base64_img, block_details)
-                
-
-                # cleaned_output = clean_llm_response(block_json)
-
-                
-
-
-        #         # Save cleaned output
-                
-
-        #         # Generate audio and speech marks
-                audio_metadata = {}
-                entries = block_json.items() if isinstance(block_json, dict) else enumerate(block_json)
-
-                for block_id, data in entries:
-                    ssml = data.get("ssml")
-                    if not ssml:
-                        logger.warning("No SSML found for block %s on page %d", block_id, page_number)
-                        continue
-                    audio_path, marks_path = save_audio_and_speech_marks(
-                        polly_client, f"{page_number}_{block_id}", ssml, output_dir , data.get("person_type")  , block_json , block_id
-                    )
-                    
-                    vertex_path = os.path.join(output_dir, f"{pdf_file.filename}_page_{page_number}_trimmed_blocks.json")
-                    with open(vertex_path, "w") as f:
-                        json.dump(block_json, f, indent=4)
-                    logger.info("Saved trimmed block JSON for page %d", page_number)
-
-                    audio_metadata[block_id] = {
-                        "audio_path": audio_path,
-                        "speech_marks_path": marks_path
-                    }
-                    logger.info("Saved audio and speech marks for block %s on page %d", block_id, page_number)
-
-                # Save audio metadata
-                metadata_path = os.path.join(output_dir, f"page_{page_number}_audio_speech_marks_metadata.json")
-                with open(metadata_path, "w") as f:
-                    json.dump(audio_metadata, f, indent=4)
-                logger.info("Saved metadata for page %d", page_number)
-
-                results.append({
-                    "page_number": page_number,
-                    "annotated_image_path": annotated_image_path,
-                    "json_path": json_path,
-                    "vertex_trimmed_path": vertex_path,
-                    "metadata_path": metadata_path
-                })
+            page_count = len(pdf)
+
+        for page_number in range(page_count):
+            results.append(process_pdf_page(
+                pdf_path, page_number, output_dir, pdf_file.filename, polly_client, write_loose_files=write_loose_files
+            ))
 
         return {
             "status": "success",
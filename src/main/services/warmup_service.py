@@ -0,0 +1,127 @@
+import logging
+import os
+import threading
+import time
+
+from src.main.utils.polly_session_utils import get_polly_client, reset_polly_client
+from src.main.utils.vertex_ai_utils import initialize_vertex_ai, reset_vertex_ai
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between warm-up attempts after a failure, so readiness probes do not hammer the clients.
+WARM_UP_RETRY_SECONDS = 30
+
+# One of: "pending", "running", "completed", "failed", "skipped"
+_warmup_state = "pending"
+# Client name -> {"available": bool, "error": str or None}
+_client_status = {}
+_last_attempt_time = None
+_warmup_duration_seconds = None
+_warmup_lock = threading.Lock()
+
+
+def _warm_up_polly():
+    if get_polly_client() is None:
+        raise RuntimeError("Polly client is not available.")
+
+
+def _warm_up_vertex_ai():
+    if not initialize_vertex_ai():
+        raise RuntimeError("Vertex AI is not available.")
+    # Building the model is what imports the Vertex AI SDK.
+    from src.main.utils.generate_block_json_utils import get_generative_model
+    get_generative_model()
+
+
+# Client name -> (warm-up function, reset function used before a retry)
+_CLIENT_WARMERS = {
+    "polly": (_warm_up_polly, reset_polly_client),
+    "vertex_ai": (_warm_up_vertex_ai, reset_vertex_ai),
+}
+
+
+def get_required_clients():
+    """
+    Clients that must be available before /ready reports ready, from the
+    comma-separated READY_REQUIRED_CLIENTS env var. By default no client is
+    required, because the pipeline falls back when Polly or Vertex AI is missing.
+    """
+    value = os.getenv('READY_REQUIRED_CLIENTS', '')
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def warm_up_clients():
+    """
+    Creates the Polly client, initializes Vertex AI and builds the Gemini model
+    ahead of the first request. Each client is warmed independently. Runs once,
+    unless a required client failed, in which case a later call retries it.
+    """
+    global _warmup_state, _last_attempt_time, _warmup_duration_seconds
+
+    with _warmup_lock:
+        if _warmup_state not in ("pending", "failed"):
+            return
+        retrying = _warmup_state == "failed"
+        _warmup_state = "running"
+        _last_attempt_time = time.monotonic()
+
+    start = time.perf_counter()
+    for name, (warm_up, reset) in _CLIENT_WARMERS.items():
+        if _client_status.get(name, {}).get("available"):
+            continue
+        if retrying:
+            reset()
+        try:
+            warm_up()
+            _client_status[name] = {"available": True, "error": None}
+        except Exception as e:
+            logger.warning("Warm-up of %s failed: %s", name, str(e))
+            _client_status[name] = {"available": False, "error": str(e)}
+
+    missing = [name for name in get_required_clients() if not _client_status.get(name, {}).get("available")]
+    _warmup_duration_seconds = time.perf_counter() - start
+    _warmup_state = "failed" if missing else "completed"
+    logger.info("Client warm-up %s in %.2f seconds", _warmup_state, _warmup_duration_seconds)
+
+
+def mark_warm_up_skipped():
+    """Records that warm-up is disabled, so readiness does not wait for it."""
+    global _warmup_state
+
+    with _warmup_lock:
+        if _warmup_state == "pending":
+            _warmup_state = "skipped"
+
+
+def start_background_warm_up():
+    """Runs warm_up_clients in a daemon thread so the server can start accepting connections."""
+    thread = threading.Thread(target=warm_up_clients, name="client-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def retry_failed_warm_up():
+    """Starts another background warm-up if the last one failed long enough ago."""
+    if _warmup_state != "failed":
+        return None
+    if _last_attempt_time is not None and time.monotonic() - _last_attempt_time < WARM_UP_RETRY_SECONDS:
+        return None
+    return start_background_warm_up()
+
+
+def get_readiness():
+    required = get_required_clients()
+    errors = [
+        f"{name}: {_client_status.get(name, {}).get('error') or 'not warmed up'}"
+        for name in required
+        if not _client_status.get(name, {}).get("available")
+    ]
+    return {
+        "ready": _warmup_state in ("completed", "skipped"),
+        "warmup_state": _warmup_state,
+        "warmup_error": "; ".join(errors) if _warmup_state == "failed" else None,
+        "required_clients": required,
+        "clients": {name: dict(_client_status.get(name, {"available": False, "error": None}))
+                    for name in _CLIENT_WARMERS},
+        "warmup_duration_seconds": _warmup_duration_seconds,
+    }
@@ -0,0 +1,120 @@
+import json
+import os
+import struct
+
+# Bundle layout:
+#   magic (4 bytes) | version (uint16) | index length (uint32) | index JSON | data section
+# The index JSON lists every block with its text, compact word timings and the
+# offset/length of its audio inside the data section, so a reader can fetch the
+# index first and then request only the audio ranges it needs.
+BUNDLE_MAGIC = b"R2RB"
+BUNDLE_VERSION = 1
+BUNDLE_HEADER_FORMAT = ">4sHI"
+BUNDLE_HEADER_SIZE = struct.calcsize(BUNDLE_HEADER_FORMAT)
+BUNDLE_EXTENSION = ".r2rb"
+
+
+def compact_speech_marks(speech_marks):
+    """Converts Polly word marks to [time, start, end, value] rows."""
+    return [
+        [mark.get("time"), mark.get("start"), mark.get("end"), mark.get("value")]
+        for mark in speech_marks
+        if mark.get("type", "word") == "word"
+    ]
+
+
+def write_page_bundle(bundle_path, page_number, image_bytes, block_json, audio_by_block):
+    """
+    Packs a page's image, block details, word timings and per-block audio into a
+    single indexed file. audio_by_block maps block IDs to MP3 bytes; blocks without
+    an entry, or with empty audio, are indexed with no audio. Returns the bundle path.
+    """
+    data_chunks = []
+    data_length = 0
+
+    def append_bytes(content, content_type):
+        nonlocal data_length
+        entry = {"offset": data_length, "length": len(content), "content_type": content_type}
+        data_chunks.append(content)
+        data_length += len(content)
+        return entry
+
+    index = {"page_number": page_number, "image": None, "blocks": {}}
+    if image_bytes is not None:
+        index["image"] = append_bytes(image_bytes, "image/png")
+
+    entries = block_json.items() if isinstance(block_json, dict) else enumerate(block_json or [])
+    for block_id, data in entries:
+        block_entry = {
+            "text": data.get("text", ""),
+            "words": data.get("words", []),
+            "bounding_boxes": data.get("bounding_boxes", []),
+            "dialog": data.get("dialog"),
+            "person_type": data.get("person_type"),
+            "timing": compact_speech_marks(data.get("timing", [])),
+            "audio": None
+        }
+        audio_bytes = audio_by_block.get(block_id)
+        # An empty clip (e.g. Polly unavailable) is indexed as no audio, since a
+        # zero-length entry cannot be expressed as a valid HTTP Range.
+        if audio_bytes:
+            block_entry["audio"] = append_bytes(audio_bytes, "audio/mpeg")
+        index["blocks"][str(block_id)] = block_entry
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    # Write to a temporary file first so a half-written bundle is never mistaken for a complete page.
+    tmp_path = f"{bundle_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(struct.pack(BUNDLE_HEADER_FORMAT, BUNDLE_MAGIC, BUNDLE_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for chunk in data_chunks:
+            f.write(chunk)
+    os.replace(tmp_path, bundle_path)
+    return bundle_path
+
+
+def _validate_entry(entry, bundle_path):
+    if entry is None:
+        return
+    if not isinstance(entry, dict) or not all(isinstance(entry.get(key), int) for key in ("offset", "length")):
+        raise ValueError(f"Bundle index has an invalid data entry: {bundle_path}")
+
+
+def _validate_index(index, bundle_path):
+    if not isinstance(index, dict) or not isinstance(index.get("blocks"), dict) or "image" not in index:
+        raise ValueError(f"Bundle index is missing image or blocks: {bundle_path}")
+    _validate_entry(index["image"], bundle_path)
+    for block in index["blocks"].values():
+        if not isinstance(block, dict) or "audio" not in block:
+            raise ValueError(f"Bundle index has an invalid block: {bundle_path}")
+        _validate_entry(block["audio"], bundle_path)
+
+
+def read_bundle_index(bundle_path):
+    """
+    Reads the index of a bundle. Offsets in the returned index are absolute
+    positions in the file, ready to be used in an HTTP Range header.
+    """
+    with open(bundle_path, "rb") as f:
+        header = f.read(BUNDLE_HEADER_SIZE)
+        if len(header) != BUNDLE_HEADER_SIZE:
+            raise ValueError(f"Not a valid bundle: {bundle_path}")
+        magic, version, index_length = struct.unpack(BUNDLE_HEADER_FORMAT, header)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Not a valid bundle: {bundle_path}")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported bundle version {version}: {bundle_path}")
+        try:
+            index = json.loads(f.read(index_length).decode("utf-8"))
+        except ValueError as e:
+            raise ValueError(f"Bundle index is not valid JSON: {bundle_path}") from e
+
+    _validate_index(index, bundle_path)
+
+    data_offset = BUNDLE_HEADER_SIZE + index_length
+    entries = [index["image"]] + [block["audio"] for block in index["blocks"].values()]
+    for entry in entries:
+        if entry is not None:
+            entry["offset"] += data_offset
+    index["data_offset"] = data_offset
+    return index
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import tempfile
+
+# On-disk cache directory installed by the bulk command; None disables caching.
+# Entries are content-addressed, so every worker process and every nightly run
+# can share the same directory.
+_cache_dir = None
+
+
+def configure_cache(cache_dir):
+    global _cache_dir
+    _cache_dir = cache_dir
+    if cache_dir:
+        os.makedirs(os.path.join(cache_dir, "gemini"), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, "polly"), exist_ok=True)
+
+
+def make_cache_key(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, (str, bytes)):
+            part = json.dumps(part, sort_keys=True, default=str)
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def _write_atomically(path, content):
+    # Workers may race on the same key; os.replace makes the last complete write win.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def load_cached_block_json(key):
+    if not _cache_dir:
+        return None
+    path = os.path.join(_cache_dir, "gemini", f"{key}.json")
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def store_cached_block_json(key, block_json):
+    if not _cache_dir:
+        return
+    path = os.path.join(_cache_dir, "gemini", f"{key}.json")
+    _write_atomically(path, json.dumps(block_json).encode("utf-8"))
+
+
+def load_cached_audio(key):
+    """Returns (audio_bytes, speech_marks) for a cached synthesis, or None."""
+    if not _cache_dir:
+        return None
+    audio_path = os.path.join(_cache_dir, "polly", f"{key}.mp3")
+    marks_path = os.path.join(_cache_dir, "polly", f"{key}.json")
+    # Marks are written last, so their presence means the entry is complete.
+    if not os.path.exists(marks_path):
+        return None
+    with open(audio_path, "rb") as f:
+        audio_bytes = f.read()
+    with open(marks_path) as f:
+        speech_marks = json.load(f)
+    return audio_bytes, speech_marks
+
+
+def store_cached_audio(key, audio_bytes, speech_marks):
+    if not _cache_dir:
+        return
+    _write_atomically(os.path.join(_cache_dir, "polly", f"{key}.mp3"), audio_bytes)
+    _write_atomically(os.path.join(_cache_dir, "polly", f"{key}.json"), json.dumps(speech_marks).encode("utf-8"))
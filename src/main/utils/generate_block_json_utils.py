@@ -4,9 +4,11 @@ import logging
 import time  # For retry delay
 from typing import Dict, Any, Optional
 import os  # For path operations
+import threading
 from datetime import datetime  # For timestamped filenames
 
-from vertexai.generative_models import GenerativeModel, Part, SafetySetting, HarmCategory, HarmBlockThreshold
+from src.main.utils.vertex_ai_utils import initialize_vertex_ai
+from src.main.utils.rate_limit_utils import wait_for_rate_limit
 
 # --- Configuration ---
 MODEL_NAME = "gemini-2.5-pro-preview-05-06"
@@ -20,15 +22,50 @@ GENERATION_CONFIG = {
     "top_p": 0.95,
 }
 
-SAFETY_SETTINGS = [
-    SafetySetting(category=HarmCategory.HARM_CATEGORY_HATE_SPEECH, threshold=HarmBlockThreshold.BLOCK_NONE),
-    SafetySetting(category=HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT, threshold=HarmBlockThreshold.BLOCK_NONE),
-    SafetySetting(category=HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT, threshold=HarmBlockThreshold.BLOCK_NONE),
-    SafetySetting(category=HarmCategory.HARM_CATEGORY_HARASSMENT, threshold=HarmBlockThreshold.BLOCK_NONE),
-]
+# The Vertex AI SDK is slow to import, so the model and safety settings are
+# built on first use rather than at module import time.
+_model = None
+_safety_settings = None
+_model_lock = threading.Lock()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def get_safety_settings():
+    """Returns the safety settings for Gemini, importing the SDK on first use."""
+    global _safety_settings
+
+    if _safety_settings is None:
+        from vertexai.generative_models import SafetySetting, HarmCategory, HarmBlockThreshold
+
+        _safety_settings = [
+            SafetySetting(category=HarmCategory.HARM_CATEGORY_HATE_SPEECH, threshold=HarmBlockThreshold.BLOCK_NONE),
+            SafetySetting(category=HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT, threshold=HarmBlockThreshold.BLOCK_NONE),
+            SafetySetting(category=HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT, threshold=HarmBlockThreshold.BLOCK_NONE),
+            SafetySetting(category=HarmCategory.HARM_CATEGORY_HARASSMENT, threshold=HarmBlockThreshold.BLOCK_NONE),
+        ]
+    return _safety_settings
+
+
+def get_generative_model():
+    """
+    Returns the shared Gemini model, creating it on first use.
+    Safe to call from multiple threads; the model is built only once.
+    """
+    global _model
+
+    if _model is not None:
+        return _model
+
+    with _model_lock:
+        if _model is None:
+            from vertexai.generative_models import GenerativeModel
+
+            initialize_vertex_ai()
+            _model = GenerativeModel(
+                MODEL_NAME,
+                generation_config=GENERATION_CONFIG,
+                safety_settings=get_safety_settings()
+            )
+    return _model
 
 
 def construct_gemini_prompt(blocks_json_str: str) -> str:
@@ -136,8 +173,8 @@ def generate_block_json(base64_image_string: str, blocks_input_json_str: str) ->
     """
     try:
         # Check if we can import vertexai (it may not be properly configured)
-        from vertexai.generative_models import GenerativeModel
-        
+        from vertexai.generative_models import Part
+
         image_part = Part.from_data(
             mime_type="image/jpeg",
             data=base64.b64decode(base64_image_string)
@@ -151,19 +188,16 @@ def generate_block_json(base64_image_string: str, blocks_input_json_str: str) ->
 
     prompt_text = construct_gemini_prompt(blocks_input_json_str)
 
-    model = GenerativeModel(
-        MODEL_NAME,
-        generation_config=GENERATION_CONFIG,
-        safety_settings=SAFETY_SETTINGS
-    )
+    model = get_generative_model()
 
     for attempt in range(MAX_RETRIES):
         logging.info(f"Attempting to generate content for chunk (Attempt {attempt + 1}/{MAX_RETRIES})...")
         try:
+            wait_for_rate_limit("gemini")
             response = model.generate_content(
                 [image_part, prompt_text],
                 generation_config=GENERATION_CONFIG,
-                safety_settings=SAFETY_SETTINGS,
+                safety_settings=get_safety_settings(),
                 stream=False
             )
 
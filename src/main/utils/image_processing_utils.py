@@ -4,7 +4,7 @@ import base64
 import os
 import random
 
-def extract_page_as_base64(pdf_path, page_number, output_dir, output_name):
+def extract_page_as_base64(pdf_path, page_number, output_dir, output_name, save_image=True):
     os.makedirs(output_dir, exist_ok=True)
 
     pdf_document = fitz.open(pdf_path)
@@ -13,9 +13,11 @@ def extract_page_as_base64(pdf_path, page_number, output_dir, output_name):
     image_bytes = pix.tobytes("png")
     base64_image_string = base64.b64encode(image_bytes).decode('utf-8')
     
-    image_path = os.path.join(output_dir, f"{output_name}_page_{page_number}.png")
-    with open(image_path, "wb") as img_file:
-        img_file.write(image_bytes)
+    image_path = None
+    if save_image:
+        image_path = os.path.join(output_dir, f"{output_name}_page_{page_number}.png")
+        with open(image_path, "wb") as img_file:
+            img_file.write(image_bytes)
         
     return base64_image_string, image_path, page
 
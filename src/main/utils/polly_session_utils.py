@@ -1,9 +1,19 @@
-import boto3
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+_polly_client = None
+_polly_initialized = False
+_polly_lock = threading.Lock()
+
 def initialize_polly():
+    try:
+        import boto3
+    except ImportError as e:
+        logger.error(f"Could not import boto3: {e}")
+        return None
+
     try:
         # Try to use the specific profile first
         session = boto3.Session(profile_name='123233845129_DevOpsUser', region_name='us-east-1')
@@ -21,3 +31,29 @@ def initialize_polly():
             logger.error(f"Could not initialize AWS Polly client: {e2}")
             # Return None - the service will handle this gracefully
             return None
+
+def get_polly_client():
+    """
+    Returns the shared Polly client, creating it on first use.
+    Safe to call from multiple threads; initialization runs only once.
+    """
+    global _polly_client, _polly_initialized
+
+    if _polly_initialized:
+        return _polly_client
+
+    with _polly_lock:
+        if not _polly_initialized:
+            _polly_client = initialize_polly()
+            _polly_initialized = True
+            if _polly_client is None:
+                logger.warning("Polly client is not available. Audio generation will be skipped.")
+    return _polly_client
+
+def reset_polly_client():
+    """Forgets the cached client so the next call to get_polly_client creates it again."""
+    global _polly_client, _polly_initialized
+
+    with _polly_lock:
+        _polly_client = None
+        _polly_initialized = False
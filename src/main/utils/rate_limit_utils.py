@@ -0,0 +1,37 @@
+import multiprocessing
+import time
+
+# Limiters installed by the bulk command; None means calls are not throttled.
+_rate_limiters = {}
+
+
+class RateLimiter:
+    """
+    Spaces calls at least 1 / calls_per_second apart across every process that
+    shares this limiter. The schedule lives in shared memory, so a limiter created
+    in the parent can be handed to pool workers through their initializer.
+    """
+
+    def __init__(self, calls_per_second):
+        self.interval = 1.0 / calls_per_second
+        self._next_call_time = multiprocessing.Value('d', 0.0)
+
+    def acquire(self):
+        with self._next_call_time.get_lock():
+            now = time.time()
+            call_time = max(now, self._next_call_time.value)
+            self._next_call_time.value = call_time + self.interval
+        wait = call_time - now
+        if wait > 0:
+            time.sleep(wait)
+
+
+def configure_rate_limiters(gemini_limiter=None, polly_limiter=None):
+    _rate_limiters["gemini"] = gemini_limiter
+    _rate_limiters["polly"] = polly_limiter
+
+
+def wait_for_rate_limit(name):
+    limiter = _rate_limiters.get(name)
+    if limiter is not None:
+        limiter.acquire()
@@ -2,6 +2,9 @@ import os
 import json
 import io
 
+from src.main.utils.rate_limit_utils import wait_for_rate_limit
+from src.main.utils.cache_utils import load_cached_audio, make_cache_key, store_cached_audio
+
 # Mapping person types to Amazon Polly voice IDs
 PERSON_TYPE_TO_VOICE = {
     "young boy": "Justin",
@@ -32,34 +35,56 @@ def save_block_details_as_json(block_details, output_dir, output_name, page_numb
     return json_path
 
 
-def save_audio_and_speech_marks(polly_client, block_id, ssml_output, output_dir, person_type, block_json, block_key):
+def generate_block_audio(polly_client, ssml_output, person_type, block_json, block_key):
     """
     Generates audio and speech marks for a block and updates block_json with timing data.
-    Returns paths to the audio and speech marks files.
+    Returns (audio_bytes, speech_marks); both are empty when Polly is not available.
     """
     if polly_client is None:
-        # Create dummy files when Polly is not available
-        audio_path = os.path.join(output_dir, f"block_{block_id}_audio.mp3")
-        speech_marks_path = os.path.join(output_dir, f"block_{block_id}_speech_marks.json")
-        
-        # Create empty audio file (placeholder)
-        with open(audio_path, "wb") as audio_file:
-            audio_file.write(b"")  # Empty audio file
-            
-        # Create empty speech marks
-        with open(speech_marks_path, "w") as marks_file:
-            json.dump([], marks_file, indent=4)
-            
-        # Add empty timing info to the block JSON
-        if str(block_key) in block_json:
-            block_json[str(block_key)]["timing"] = []
-            
-        return audio_path, speech_marks_path
-    
+        audio_bytes, speech_marks = b"", []
+    else:
+        audio_bytes, speech_marks = synthesize_audio_and_speech_marks(polly_client, ssml_output, person_type)
+
+    # Add timing info to the block JSON
+    if str(block_key) in block_json:
+        block_json[str(block_key)]["timing"] = speech_marks
+
+    return audio_bytes, speech_marks
+
+
+def save_audio_and_speech_marks(block_id, audio_bytes, speech_marks, output_dir):
+    """
+    Saves a block's audio and speech marks as loose files.
+    Returns paths to the audio and speech marks files.
+    """
+    audio_path = os.path.join(output_dir, f"block_{block_id}_audio.mp3")
+    with open(audio_path, "wb") as audio_file:
+        audio_file.write(audio_bytes)
+
+    # Save speech marks to file
+    speech_marks_path = os.path.join(output_dir, f"block_{block_id}_speech_marks.json")
+    with open(speech_marks_path, "w") as marks_file:
+        json.dump(speech_marks, marks_file, indent=4)
+
+    return audio_path, speech_marks_path
+
+
+def synthesize_audio_and_speech_marks(polly_client, ssml_output, person_type):
+    """
+    Calls Polly for the MP3 audio and word speech marks of an SSML string.
+    Results are served from the bulk cache when one is configured.
+    Returns (audio_bytes, speech_marks).
+    """
     # Normalize person type and get voice ID
     voice_id = PERSON_TYPE_TO_VOICE.get(person_type.lower() if person_type else None, "Joanna")
 
+    cache_key = make_cache_key("standard", voice_id, ssml_output)
+    cached = load_cached_audio(cache_key)
+    if cached is not None:
+        return cached
+
     # Generate audio
+    wait_for_rate_limit("polly")
     audio_response = polly_client.synthesize_speech(
         Engine='standard',
         OutputFormat='mp3',
@@ -67,11 +92,10 @@ def save_audio_and_speech_marks(polly_client, block_id, ssml_output, output_dir,
         TextType='ssml',
         VoiceId=voice_id
     )
-    audio_path = os.path.join(output_dir, f"block_{block_id}_audio.mp3")
-    with open(audio_path, "wb") as audio_file:
-        audio_file.write(audio_response['AudioStream'].read())
+    audio_bytes = audio_response['AudioStream'].read()
 
     # Generate speech marks
+    wait_for_rate_limit("polly")
     speech_marks_response = polly_client.synthesize_speech(
         Engine='standard',
         OutputFormat='json',
@@ -90,13 +114,5 @@ def save_audio_and_speech_marks(polly_client, block_id, ssml_output, output_dir,
         except json.JSONDecodeError:
             continue
 
-    # Save speech marks to file
-    speech_marks_path = os.path.join(output_dir, f"block_{block_id}_speech_marks.json")
-    with open(speech_marks_path, "w") as marks_file:
-        json.dump(speech_marks, marks_file, indent=4)
-
-    # Add timing info to the block JSON
-    if str(block_key) in block_json:
-        block_json[str(block_key)]["timing"] = speech_marks
-
-    return audio_path, speech_marks_path
+    store_cached_audio(cache_key, audio_bytes, speech_marks)
+    return audio_bytes, speech_marks
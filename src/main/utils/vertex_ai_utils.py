@@ -0,0 +1,50 @@
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+_vertex_ai_available = False
+_vertex_ai_initialized = False
+_vertex_ai_lock = threading.Lock()
+
+def initialize_vertex_ai():
+    """
+    Initializes the Vertex AI SDK once, on first use.
+    Returns True if Vertex AI is configured and ready, False otherwise.
+    """
+    global _vertex_ai_available, _vertex_ai_initialized
+
+    if _vertex_ai_initialized:
+        return _vertex_ai_available
+
+    with _vertex_ai_lock:
+        if _vertex_ai_initialized:
+            return _vertex_ai_available
+
+        project = os.getenv('VERTEX_AI_PROJECT')
+        location = os.getenv('VERTEX_AI_LOCATION')
+
+        try:
+            if project and location:
+                import vertexai
+
+                vertexai.init(project=project, location=location)
+                _vertex_ai_available = True
+                logger.info("Vertex AI initialized successfully.")
+            else:
+                logger.warning("Vertex AI credentials not configured. Some features may not work.")
+        except Exception as e:
+            logger.error("Failed to initialize Vertex AI: %s", str(e))
+            logger.warning("Continuing without Vertex AI. Some features may not work.")
+
+        _vertex_ai_initialized = True
+    return _vertex_ai_available
+
+def reset_vertex_ai():
+    """Forgets a previous initialization so the next call to initialize_vertex_ai tries again."""
+    global _vertex_ai_available, _vertex_ai_initialized
+
+    with _vertex_ai_lock:
+        _vertex_ai_available = False
+        _vertex_ai_initialized = False
@@ -0,0 +1,111 @@
+import os
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from src.main.constants.constants import OUTPUT_ROOT
+from src.main.services.bulk_tts_service import _find_pending_pages, _plan_books, collect_pdf_paths
+from src.main.services.tts_service import get_page_bundle_path
+
+
+def _make_pdf(path, page_count=1):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with fitz.open() as pdf:
+        for _ in range(page_count):
+            pdf.new_page()
+        pdf.save(str(path))
+    return str(path)
+
+
+def test_collect_pdf_paths_from_directory(tmp_path):
+    first = _make_pdf(tmp_path / "books" / "a.pdf")
+    second = _make_pdf(tmp_path / "books" / "grade_3" / "b.PDF")
+    (tmp_path / "books" / "notes.txt").write_text("not a pdf")
+
+    assert collect_pdf_paths(str(tmp_path / "books")) == sorted([first, second])
+
+
+def test_collect_pdf_paths_from_single_pdf(tmp_path):
+    pdf_path = _make_pdf(tmp_path / "book.pdf")
+
+    assert collect_pdf_paths(pdf_path) == [pdf_path]
+
+
+def test_collect_pdf_paths_from_manifest(tmp_path):
+    absolute = _make_pdf(tmp_path / "elsewhere" / "c.pdf")
+    manifest = tmp_path / "library" / "manifest.txt"
+    manifest.parent.mkdir()
+    manifest.write_text(f"# nightly library\n\nbooks/a.pdf\n  {absolute}  \n# books/skipped.pdf\n")
+
+    assert collect_pdf_paths(str(manifest)) == [
+        os.path.join(str(tmp_path / "library"), "books/a.pdf"),
+        absolute
+    ]
+
+
+def test_collect_pdf_paths_missing_source(tmp_path):
+    assert collect_pdf_paths(str(tmp_path / "missing")) == []
+
+
+def test_plan_books_deduplicates_names(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pdf_paths = [_make_pdf(tmp_path / "a" / "book.pdf"), _make_pdf(tmp_path / "b" / "book.pdf", page_count=2)]
+
+    books = _plan_books(pdf_paths, resume=False)
+
+    names = [os.path.basename(book["output_dir"]) for book in books]
+    assert names[0].startswith("book-") and names[1].startswith("book-2-")
+    assert [book["page_count"] for book in books] == [1, 2]
+
+
+def test_plan_books_records_unreadable_pdf(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+
+    books = _plan_books([str(broken), _make_pdf(tmp_path / "ok.pdf")], resume=False)
+
+    assert "pdf" in books[0]["errors"]
+    assert books[0]["output_dir"] is None
+    assert books[1]["errors"] == {} and books[1]["page_count"] == 1
+
+
+def test_resume_directory_follows_pdf_identity_not_input_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    old_book = _make_pdf(tmp_path / "b" / "book.pdf")
+    new_book = _make_pdf(tmp_path / "a" / "book.pdf")
+
+    first_run = _plan_books([old_book], resume=True)
+    second_run = _plan_books([new_book, old_book], resume=True)
+
+    assert second_run[1]["output_dir"] == first_run[0]["output_dir"]
+    assert second_run[0]["output_dir"] != first_run[0]["output_dir"]
+    assert os.path.dirname(first_run[0]["output_dir"]) == OUTPUT_ROOT
+
+
+def test_resume_skips_pages_with_bundles(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    books = _plan_books([_make_pdf(tmp_path / "book.pdf", page_count=3)], resume=True)
+    book = books[0]
+    with open(get_page_bundle_path(book["output_dir"], book["output_name"], 1), "wb") as f:
+        f.write(b"done")
+
+    pending, skipped = _find_pending_pages(books, resume=True)
+
+    assert skipped == 1
+    assert [page_number for _, page_number in pending] == [0, 2]
+    assert book["results"] == [{"page_number": 1, "skipped": True}]
+
+
+def test_without_resume_no_pages_are_skipped(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    books = _plan_books([_make_pdf(tmp_path / "book.pdf", page_count=2)], resume=False)
+    book = books[0]
+    with open(get_page_bundle_path(book["output_dir"], book["output_name"], 0), "wb") as f:
+        f.write(b"done")
+
+    pending, skipped = _find_pending_pages(books, resume=False)
+
+    assert skipped == 0
+    assert len(pending) == 2
@@ -0,0 +1,51 @@
+import struct
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.main.constants.constants import OUTPUT_ROOT
+from src.main.controllers.bundle_controller import router
+from src.main.utils.bundle_utils import BUNDLE_HEADER_FORMAT, BUNDLE_MAGIC, BUNDLE_VERSION, write_page_bundle
+
+AUDIO_BYTES = b"ID3 fake mp3 audio"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / OUTPUT_ROOT / "book").mkdir(parents=True)
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return TestClient(app)
+
+
+def test_index_and_range_download(client, tmp_path):
+    bundle_path = str(tmp_path / OUTPUT_ROOT / "book" / "page.r2rb")
+    write_page_bundle(bundle_path, 0, b"image", {"1": {"text": "Hi"}}, {"1": AUDIO_BYTES})
+
+    index = client.get("/api/bundles/book/page.r2rb/index").json()
+    audio = index["blocks"]["1"]["audio"]
+    start, end = audio["offset"], audio["offset"] + audio["length"] - 1
+    response = client.get("/api/bundles/book/page.r2rb", headers={"Range": f"bytes={start}-{end}"})
+
+    assert response.status_code == 206
+    assert response.content == AUDIO_BYTES
+
+
+def test_malformed_index_returns_422(client, tmp_path):
+    index_bytes = b'{"page_number": 0}'
+    (tmp_path / OUTPUT_ROOT / "book" / "bad.r2rb").write_bytes(
+        struct.pack(BUNDLE_HEADER_FORMAT, BUNDLE_MAGIC, BUNDLE_VERSION, len(index_bytes)) + index_bytes
+    )
+
+    assert client.get("/api/bundles/book/bad.r2rb/index").status_code == 422
+
+
+def test_missing_bundle_returns_404(client):
+    assert client.get("/api/bundles/book/missing.r2rb").status_code == 404
+    assert client.get("/api/bundles/book/missing.r2rb/index").status_code == 404
@@ -0,0 +1,42 @@
+import os
+
+from src.main.constants.constants import OUTPUT_ROOT
+from src.main.services.bundle_service import resolve_bundle_path
+from src.main.utils.bundle_utils import write_page_bundle
+
+
+def _make_bundle(tmp_path, folder, name):
+    bundle_dir = tmp_path / OUTPUT_ROOT / folder
+    bundle_dir.mkdir(parents=True)
+    bundle_path = str(bundle_dir / name)
+    write_page_bundle(bundle_path, 0, b"image", {}, {})
+    return bundle_path
+
+
+def test_resolves_bundle_inside_output_root(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bundle_path = _make_bundle(tmp_path, "book-01-01-2026-00-00-00", "book.pdf_page_0.r2rb")
+
+    resolved = resolve_bundle_path("book-01-01-2026-00-00-00", "book.pdf_page_0.r2rb")
+
+    assert resolved == os.path.realpath(bundle_path)
+
+
+def test_rejects_parent_directory_traversal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _make_bundle(tmp_path, "book", "page.r2rb")
+    # A bundle that exists, but outside the output root
+    (tmp_path / "secret.r2rb").write_bytes(b"R2RB")
+
+    assert resolve_bundle_path("..", "secret.r2rb") is None
+    assert resolve_bundle_path("book", "../../secret.r2rb") is None
+    assert resolve_bundle_path("..", "book/page.r2rb") is None
+
+
+def test_rejects_non_bundle_names(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _make_bundle(tmp_path, "book", "page.r2rb")
+    (tmp_path / OUTPUT_ROOT / "book" / "page_0_audio_speech_marks_metadata.json").write_text("{}")
+
+    assert resolve_bundle_path("book", "page_0_audio_speech_marks_metadata.json") is None
+    assert resolve_bundle_path("book", "missing.r2rb") is None
@@ -0,0 +1,119 @@
+import struct
+
+import pytest
+
+from src.main.utils.bundle_utils import (
+    BUNDLE_HEADER_FORMAT, BUNDLE_MAGIC, BUNDLE_VERSION, read_bundle_index, write_page_bundle
+)
+
+IMAGE_BYTES = b"\x89PNG fake image"
+AUDIO_BYTES = b"ID3 fake mp3 audio"
+
+BLOCK_JSON = {
+    "3": {
+        "text": "Hello there!",
+        "words": ["Hello", "there!"],
+        "bounding_boxes": [[[0, 0], [10, 10]], [[12, 0], [30, 10]]],
+        "dialog": "true",
+        "person_type": "young boy",
+        "timing": [
+            {"time": 6, "type": "word", "start": 0, "end": 5, "value": "Hello"},
+            {"time": 380, "type": "word", "start": 6, "end": 12, "value": "there!"}
+        ]
+    },
+    "7": {
+        "text": "Page 12",
+        "words": ["Page", "12"],
+        "bounding_boxes": [],
+        "dialog": "false",
+        "person_type": "null"
+    }
+}
+
+
+def _slice(path, entry):
+    with open(path, "rb") as f:
+        content = f.read()
+    return content[entry["offset"]:entry["offset"] + entry["length"]]
+
+
+def test_round_trip_offsets_slice_exact_bytes(tmp_path):
+    bundle_path = str(tmp_path / "book.pdf_page_0.r2rb")
+    write_page_bundle(bundle_path, 0, IMAGE_BYTES, BLOCK_JSON, {"3": AUDIO_BYTES})
+
+    index = read_bundle_index(bundle_path)
+
+    assert index["page_number"] == 0
+    assert _slice(bundle_path, index["image"]) == IMAGE_BYTES
+    assert _slice(bundle_path, index["blocks"]["3"]["audio"]) == AUDIO_BYTES
+    assert index["blocks"]["3"]["timing"] == [[6, 0, 5, "Hello"], [380, 6, 12, "there!"]]
+    assert index["blocks"]["3"]["person_type"] == "young boy"
+
+
+def test_blocks_without_audio_are_indexed(tmp_path):
+    bundle_path = str(tmp_path / "page.r2rb")
+    write_page_bundle(bundle_path, 4, None, BLOCK_JSON, {})
+
+    index = read_bundle_index(bundle_path)
+
+    assert index["image"] is None
+    assert index["blocks"]["3"]["audio"] is None
+    assert index["blocks"]["7"]["audio"] is None
+    assert index["blocks"]["7"]["timing"] == []
+    assert index["blocks"]["7"]["text"] == "Page 12"
+
+
+def test_empty_audio_is_indexed_as_no_audio(tmp_path):
+    bundle_path = str(tmp_path / "silent.r2rb")
+    write_page_bundle(bundle_path, 0, IMAGE_BYTES, BLOCK_JSON, {"3": b"", "7": AUDIO_BYTES})
+
+    index = read_bundle_index(bundle_path)
+
+    assert index["blocks"]["3"]["audio"] is None
+    assert _slice(bundle_path, index["blocks"]["7"]["audio"]) == AUDIO_BYTES
+
+
+def _write_raw_index(path, index_bytes):
+    path.write_bytes(struct.pack(BUNDLE_HEADER_FORMAT, BUNDLE_MAGIC, BUNDLE_VERSION, len(index_bytes)) + index_bytes)
+    return str(path)
+
+
+@pytest.mark.parametrize("index_bytes", [
+    b"{}",
+    b'{"image": null}',
+    b'{"blocks": {}}',
+    b'{"image": null, "blocks": []}',
+    b'{"image": null, "blocks": {"0": {"text": "no audio key"}}}',
+    b'{"image": {"offset": "0"}, "blocks": {}}',
+    b"[]",
+    b"not json",
+])
+def test_malformed_index_raises_value_error(tmp_path, index_bytes):
+    bundle_path = _write_raw_index(tmp_path / "malformed.r2rb", index_bytes)
+
+    with pytest.raises(ValueError):
+        read_bundle_index(bundle_path)
+
+
+def test_bad_magic_raises_value_error(tmp_path):
+    bundle_path = tmp_path / "bad.r2rb"
+    bundle_path.write_bytes(struct.pack(BUNDLE_HEADER_FORMAT, b"NOPE", BUNDLE_VERSION, 2) + b"{}")
+
+    with pytest.raises(ValueError):
+        read_bundle_index(str(bundle_path))
+
+
+def test_unsupported_version_raises_value_error(tmp_path):
+    bundle_path = tmp_path / "future.r2rb"
+    bundle_path.write_bytes(struct.pack(BUNDLE_HEADER_FORMAT, BUNDLE_MAGIC, BUNDLE_VERSION + 1, 2) + b"{}")
+
+    with pytest.raises(ValueError):
+        read_bundle_index(str(bundle_path))
+
+
+def test_truncated_header_raises_value_error(tmp_path):
+    bundle_path = tmp_path / "short.r2rb"
+    bundle_path.write_bytes(b"R2")
+
+    with pytest.raises(ValueError):
+        read_bundle_index(str(bundle_path))
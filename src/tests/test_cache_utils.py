@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from src.main.utils import cache_utils
+from src.main.utils.cache_utils import (
+    configure_cache, load_cached_audio, load_cached_block_json, make_cache_key,
+    store_cached_audio, store_cached_block_json
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_utils, "_cache_dir", None)
+    configure_cache(str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def test_cache_key_depends_on_every_part():
+    key = make_cache_key("standard", "Joanna", "<speak>Hi</speak>")
+
+    assert key == make_cache_key("standard", "Joanna", "<speak>Hi</speak>")
+    assert key != make_cache_key("standard", "Justin", "<speak>Hi</speak>")
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+    assert make_cache_key({1: {"text": "a"}}) == make_cache_key({1: {"text": "a"}})
+
+
+def test_block_json_round_trip(cache_dir):
+    key = make_cache_key("model", "image", {"0": {"text": "Hello"}})
+    assert load_cached_block_json(key) is None
+
+    store_cached_block_json(key, {"0": {"text": "Hello", "ssml": "<speak>Hello</speak>"}})
+
+    assert load_cached_block_json(key) == {"0": {"text": "Hello", "ssml": "<speak>Hello</speak>"}}
+
+
+def test_audio_round_trip(cache_dir):
+    key = make_cache_key("standard", "Joanna", "<speak>Hello</speak>")
+    marks = [{"time": 6, "type": "word", "start": 0, "end": 5, "value": "Hello"}]
+    assert load_cached_audio(key) is None
+
+    store_cached_audio(key, b"mp3 bytes", marks)
+
+    assert load_cached_audio(key) == (b"mp3 bytes", marks)
+
+
+def test_audio_without_marks_is_a_miss(cache_dir):
+    key = make_cache_key("standard", "Joanna", "<speak>Partial</speak>")
+    store_cached_audio(key, b"mp3 bytes", [])
+    os.remove(cache_dir / "polly" / f"{key}.json")
+
+    assert load_cached_audio(key) is None
+
+
+def test_cache_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(cache_utils, "_cache_dir", None)
+    key = make_cache_key("anything")
+
+    store_cached_block_json(key, {"0": {}})
+    store_cached_audio(key, b"mp3", [])
+
+    assert load_cached_block_json(key) is None
+    assert load_cached_audio(key) is None
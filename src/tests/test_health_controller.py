@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.main.controllers.health_controller import router
+from src.main.services import warmup_service
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def fresh_warmup_state(monkeypatch):
+    monkeypatch.setattr(warmup_service, "_client_status", {})
+    monkeypatch.setattr(warmup_service, "_last_attempt_time", None)
+    monkeypatch.delenv("READY_REQUIRED_CLIENTS", raising=False)
+
+
+def test_health_is_always_ok(client, monkeypatch):
+    monkeypatch.setattr(warmup_service, "_warmup_state", "pending")
+
+    assert client.get("/health").status_code == 200
+
+
+@pytest.mark.parametrize("state, status_code, status", [
+    ("pending", 503, "Warming up"),
+    ("running", 503, "Warming up"),
+    ("completed", 200, "Ready"),
+    ("skipped", 200, "Ready"),
+])
+def test_ready_status_codes(client, monkeypatch, state, status_code, status):
+    monkeypatch.setattr(warmup_service, "_warmup_state", state)
+
+    response = client.get("/ready")
+
+    assert response.status_code == status_code
+    assert response.json()["status"] == status
+
+
+def test_ready_reports_failure_and_schedules_retry(client, monkeypatch):
+    monkeypatch.setattr(warmup_service, "_warmup_state", "failed")
+    retries = []
+    monkeypatch.setattr(
+        "src.main.controllers.health_controller.retry_failed_warm_up", lambda: retries.append(True)
+    )
+
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "Not ready"
+    assert retries == [True]
@@ -0,0 +1,35 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.main.utils import rate_limit_utils
+from src.main.utils.rate_limit_utils import RateLimiter, configure_rate_limiters, wait_for_rate_limit
+
+
+def _init_worker(limiter):
+    configure_rate_limiters(gemini_limiter=limiter)
+
+
+def _timed_call(_):
+    wait_for_rate_limit("gemini")
+    return time.time()
+
+
+def test_rate_limiter_spaces_calls_across_processes():
+    limiter = RateLimiter(calls_per_second=20)
+
+    with ProcessPoolExecutor(max_workers=4, initializer=_init_worker, initargs=(limiter,)) as executor:
+        call_times = sorted(executor.map(_timed_call, range(10)))
+
+    gaps = [later - earlier for earlier, later in zip(call_times, call_times[1:])]
+    # 10 calls at 20/s need at least 9 intervals of 50 ms, whichever process made them.
+    assert call_times[-1] - call_times[0] >= 9 * 0.05 - 0.01
+    assert min(gaps) >= 0.05 - 0.01
+
+
+def test_wait_without_limiter_does_not_block(monkeypatch):
+    monkeypatch.setattr(rate_limit_utils, "_rate_limiters", {})
+
+    start = time.perf_counter()
+    wait_for_rate_limit("polly")
+
+    assert time.perf_counter() - start < 0.01
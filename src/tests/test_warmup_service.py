@@ -0,0 +1,121 @@
+import pytest
+
+from src.main.services import warmup_service
+
+
+@pytest.fixture(autouse=True)
+def fresh_warmup_state(monkeypatch):
+    monkeypatch.setattr(warmup_service, "_warmup_state", "pending")
+    monkeypatch.setattr(warmup_service, "_client_status", {})
+    monkeypatch.setattr(warmup_service, "_last_attempt_time", None)
+    monkeypatch.setattr(warmup_service, "_warmup_duration_seconds", None)
+    monkeypatch.delenv("READY_REQUIRED_CLIENTS", raising=False)
+
+
+def _set_warmers(monkeypatch, polly, vertex_ai, resets=None):
+    resets = resets if resets is not None else []
+    monkeypatch.setattr(warmup_service, "_CLIENT_WARMERS", {
+        "polly": (polly, lambda: resets.append("polly")),
+        "vertex_ai": (vertex_ai, lambda: resets.append("vertex_ai")),
+    })
+    return resets
+
+
+def _ok():
+    pass
+
+
+def _fail():
+    raise RuntimeError("client unavailable")
+
+
+def test_pending_until_warm_up_runs():
+    readiness = warmup_service.get_readiness()
+
+    assert readiness["ready"] is False
+    assert readiness["warmup_state"] == "pending"
+
+
+def test_state_is_running_during_warm_up_then_completed(monkeypatch):
+    seen_states = []
+    _set_warmers(monkeypatch, lambda: seen_states.append(warmup_service.get_readiness()["warmup_state"]), _ok)
+
+    warmup_service.warm_up_clients()
+
+    assert seen_states == ["running"]
+    readiness = warmup_service.get_readiness()
+    assert readiness["ready"] is True
+    assert readiness["warmup_state"] == "completed"
+    assert readiness["clients"]["polly"] == {"available": True, "error": None}
+
+
+def test_optional_client_failure_does_not_block_readiness(monkeypatch):
+    _set_warmers(monkeypatch, _fail, _ok)
+
+    warmup_service.warm_up_clients()
+
+    readiness = warmup_service.get_readiness()
+    assert readiness["ready"] is True
+    assert readiness["warmup_error"] is None
+    assert readiness["clients"]["polly"] == {"available": False, "error": "client unavailable"}
+    assert readiness["clients"]["vertex_ai"]["available"] is True
+
+
+def test_required_client_failure_fails_and_can_be_retried(monkeypatch):
+    monkeypatch.setenv("READY_REQUIRED_CLIENTS", "vertex_ai")
+    resets = _set_warmers(monkeypatch, _ok, _fail)
+
+    warmup_service.warm_up_clients()
+
+    readiness = warmup_service.get_readiness()
+    assert readiness["ready"] is False
+    assert readiness["warmup_state"] == "failed"
+    assert "vertex_ai: client unavailable" in readiness["warmup_error"]
+
+    # Only the failed client is reset and warmed again.
+    _set_warmers(monkeypatch, _fail, _ok, resets)
+    warmup_service.warm_up_clients()
+
+    assert resets == ["vertex_ai"]
+    readiness = warmup_service.get_readiness()
+    assert readiness["ready"] is True
+    assert readiness["clients"]["polly"]["available"] is True
+
+
+def test_one_client_raising_does_not_skip_the_other(monkeypatch):
+    warmed = []
+    _set_warmers(monkeypatch, _fail, lambda: warmed.append("vertex_ai"))
+
+    warmup_service.warm_up_clients()
+
+    assert warmed == ["vertex_ai"]
+
+
+def test_completed_warm_up_runs_only_once(monkeypatch):
+    calls = []
+    _set_warmers(monkeypatch, lambda: calls.append("polly"), _ok)
+
+    warmup_service.warm_up_clients()
+    warmup_service.warm_up_clients()
+
+    assert calls == ["polly"]
+
+
+def test_skipped_warm_up_is_ready(monkeypatch):
+    warmup_service.mark_warm_up_skipped()
+
+    readiness = warmup_service.get_readiness()
+    assert readiness["ready"] is True
+    assert readiness["warmup_state"] == "skipped"
+
+
+def test_retry_waits_for_backoff(monkeypatch):
+    monkeypatch.setenv("READY_REQUIRED_CLIENTS", "polly")
+    _set_warmers(monkeypatch, _fail, _ok)
+    warmup_service.warm_up_clients()
+
+    assert warmup_service.retry_failed_warm_up() is None
+
+    monkeypatch.setattr(warmup_service, "WARM_UP_RETRY_SECONDS", 0)
+    warmup_service.retry_failed_warm_up().join()
+    assert warmup_service.get_readiness()["warmup_state"] == "failed"